@@ -1,84 +1,394 @@
 import streamlit as st
-import pandas as pd
-from gtts import gTTS
-import requests
 import io
-import base64
-import difflib
+import numpy as np
+from rapidfuzz.fuzz import ratio
+import re
+import unicodedata
+from pathlib import Path
+import concurrent.futures
+import collections
+import threading
+import asyncio
 
 # Page Config
 st.set_page_config(page_title="English Vocab Quiz", page_icon="📝")
 
+# Anything that is not a letter, digit or whitespace (\w also matches '_', so strip it explicitly)
+_KEEP_RE = re.compile(r'[^\w\s]+|_+')
+
+# Separators between alternative meanings in one Korean cell (e.g. "사과, 사죄")
+_ALT_SPLIT_RE = re.compile(r'[,;/]')
+
+# Per-thread scratch buffer reused across gTTS writes (getvalue() copies out)
+_TTS_BUF = threading.local()
+
+# Per-question result codes stored in st.session_state.results (np.int8)
+UNANSWERED, WRONG, CORRECT = -1, 0, 1
+# Indexed by result code + 1
+_STATUS_EMOJI = ("", "❌", "✅")
+
+# Upper bound on prefetched entries kept in each process-wide store
+PREFETCH_STORE_MAX = 5000
+
+# Seconds the whole hint prefetch batch may take before remaining lookups are dropped
+HINT_PREFETCH_DEADLINE = 30
+
+# Number of question buttons shown per sidebar page
+NAV_PAGE_SIZE = 50
+
 # --- Helper Functions ---
 def clean_text(text):
-    return "".join([c for c in text if c.isalpha() or c.isdigit() or c.isspace()]).strip()
+    return _KEEP_RE.sub('', text).strip()
 
-def is_correct(user_input, answer, threshold=0.85):
-    """Checks if the answer is correct using fuzzy matching."""
-    user_input = clean_text(str(user_input).lower())
-    answer = clean_text(str(answer).lower())
+def normalize_answer(text):
+    """Canonical form used for grading: NFC-composed, lowercased, punctuation-free."""
+    # Compose first: combining marks are not \w, so clean_text would strip them
+    return clean_text(unicodedata.normalize('NFC', str(text)).lower())
+
+def is_correct(user_input, answer_norm, threshold=0.85):
+    """Checks if the answer is correct using fuzzy matching.
+
+    answer_norm must already be in normalize_answer() form (see load_data).
+    """
+    # Cheap exact match first; normalize_answer is idempotent, so this never disagrees with the full check
+    if str(user_input).strip() == answer_norm:
+        return True
+
+    user_input = normalize_answer(user_input)
+    answer = answer_norm
     
     if user_input == answer:
         return True
     
     # Fuzzy match
-    similarity = difflib.SequenceMatcher(None, user_input, answer).ratio()
+    # score_cutoff lets RapidFuzz bail out early once the threshold is out of reach
+    similarity = ratio(user_input, answer, score_cutoff=threshold * 100) / 100.0
     return similarity >= threshold
 
-def get_audio_html(text, label="Play Audio"):
-    """Generates an HTML audio player for the given text using gTTS."""
+def meaning_key(text):
+    """Index key for a Korean meaning: normalize_answer() form with all whitespace removed."""
+    return "".join(normalize_answer(text).split())
+
+def build_meaning_index(meanings):
+    """Maps each meaning key (whole cell and each alternative) to the rows it answers."""
+    index = collections.defaultdict(list)
+    for i, meaning in enumerate(meanings):
+        keys = {meaning_key(meaning)}
+        keys.update(meaning_key(alt) for alt in _ALT_SPLIT_RE.split(meaning))
+        keys.discard("")
+        for key in keys:
+            index[key].append(i)
+    return index
+
+def is_correct_meaning(user_input, idx, threshold=0.85):
+    """Checks a Korean answer for row idx, trying the meaning index before fuzzy matching."""
+    if idx in st.session_state.kor_index.get(meaning_key(user_input), ()):
+        return True
+    return is_correct(user_input, st.session_state.korean_norm[idx], threshold)
+
+# Edge TTS neural voice per language code
+EDGE_VOICES = {'en': 'en-US-AriaNeural'}
+
+def _edge_stream(text, voice, buf):
+    import edge_tts
+
+    async def run():
+        async for chunk in edge_tts.Communicate(text, voice).stream():
+            if chunk["type"] == "audio":
+                buf.write(chunk["data"])
+
+    asyncio.run(run())
+
+def _synthesize_mp3(text, lang='en', engine='gtts'):
+    """Runs the chosen TTS engine ('gtts' or 'edge') and returns the raw MP3 bytes."""
+    # Save to memory
+    mp3_fp = getattr(_TTS_BUF, 'b', None) or io.BytesIO()
+    mp3_fp.seek(0)
+    mp3_fp.truncate()
+    if engine == 'edge':
+        _edge_stream(text, EDGE_VOICES.get(lang, EDGE_VOICES['en']), mp3_fp)
+    else:
+        from gtts import gTTS
+
+        gTTS(text=text, lang=lang).write_to_fp(mp3_fp)
+    data = mp3_fp.getvalue()
+    _TTS_BUF.b = mp3_fp
+    return data
+
+@st.cache_data(show_spinner=False, max_entries=2048)
+def _tts_mp3_bytes(text, lang='en', engine='gtts'):
+    """Synthesizes the given text with the chosen engine and returns the raw MP3 bytes."""
+    return _synthesize_mp3(text, lang, engine)
+
+def _tts_worker(text, engine='gtts'):
+    """Worker for the audio prefetch pool; returns None if synthesis fails."""
     try:
-        tts = gTTS(text=text, lang='en')
-        # Save to memory
-        mp3_fp = io.BytesIO()
-        tts.write_to_fp(mp3_fp)
-        mp3_fp.seek(0)
-        
-        # Encode to base64
-        b64 = base64.b64encode(mp3_fp.read()).decode()
-        md = f"""
-            <audio controls autoplay>
-            <source src="data:audio/mp3;base64,{b64}" type="audio/mp3">
-            </audio>
-            """
-        return md
+        return _synthesize_mp3(text, engine=engine)
+    except Exception:
+        return None
+
+class _PrefetchStore:
+    """Process-wide prefetch results shared by every session, oldest evicted first."""
+
+    def __init__(self, max_entries=PREFETCH_STORE_MAX):
+        self.max_entries = max_entries
+        self.items = {}
+        # Keys some session is fetching right now; other sessions skip them instead of waiting
+        self.in_flight = set()
+        # Guards items and in_flight only, never held across network calls
+        self.lock = threading.Lock()
+
+    def get(self, key):
+        return self.items.get(key)
+
+    def missing(self, keys):
+        return [k for k in keys if k not in self.items]
+
+    def claim(self, keys):
+        """Marks the keys nobody has stored or is fetching as in flight and returns them."""
+        with self.lock:
+            claimed = [k for k in keys if k not in self.items and k not in self.in_flight]
+            self.in_flight.update(claimed)
+        return claimed
+
+    def update(self, new_items, released=()):
+        with self.lock:
+            self.items.update(new_items)
+            self.in_flight.difference_update(released)
+            while len(self.items) > self.max_entries:
+                del self.items[next(iter(self.items))]
+
+@st.cache_resource
+def _audio_store():
+    """(engine, word) -> MP3 bytes."""
+    return _PrefetchStore()
+
+def prefetch_audio(words, engine='gtts'):
+    """Synthesizes audio for words not yet in the shared store, concurrently."""
+    store = _audio_store()
+    # Lock-free check first, so fully cached vocabularies never wait on another session
+    keys = store.missing((engine, str(w)) for w in dict.fromkeys(words))
+    if not keys:
+        return
+    claimed = store.claim(keys)
+    if not claimed:
+        return
+
+    def synthesize_and_store(key):
+        # Workers save their own result, so work finished before an interrupted rerun is kept
+        mp3 = _tts_worker(key[1], engine)
+        store.update({key: mp3} if mp3 is not None else {}, released=[key])
+
+    pool = concurrent.futures.ThreadPoolExecutor(max_workers=16)
+    futures = [pool.submit(synthesize_and_store, key) for key in claimed]
+    try:
+        with st.status("Preparing audio...", expanded=False) as status:
+            bar = st.progress(0.0)
+            for i, _ in enumerate(concurrent.futures.as_completed(futures)):
+                bar.progress((i + 1) / len(futures))
+            status.update(label="Audio ready", state="complete")
+    finally:
+        # If Streamlit interrupts the run, drop queued work instead of waiting for it
+        pool.shutdown(wait=False, cancel_futures=True)
+        store.update({}, released=[key for key, f in zip(claimed, futures) if f.cancelled()])
+
+def play_audio(text, engine='gtts'):
+    """Renders an autoplaying audio player for the given text."""
+    placeholder = st.empty()
+    try:
+        mp3 = _audio_store().get((engine, str(text)))
+        if mp3 is None:
+            # Sent to the browser before synthesis starts, then swapped for the player
+            placeholder.info("🎙️ Synthesizing...")
+            mp3 = _tts_mp3_bytes(text, engine=engine)
+        placeholder.audio(mp3, format='audio/mp3', autoplay=True)
     except Exception as e:
-        return f"Error generating audio: {e}"
+        placeholder.error(f"Error generating audio: {e}")
 
-def fetch_hint(word):
-    """Fetches definition from Dictionary API."""
+NO_DEFINITION = "No definition found."
+
+def _normalize_word(word):
+    return str(word).lower().strip()
+
+def _extract_definition(data):
+    return data[0]['meanings'][0]['definitions'][0]['definition']
+
+@st.cache_resource
+def _get_session():
+    """Shared HTTP session so hint lookups reuse pooled TLS connections."""
+    import requests
+    from requests.adapters import HTTPAdapter
+    from urllib3.util.retry import Retry
+
+    session = requests.Session()
+    session.mount('https://', HTTPAdapter(pool_connections=10, pool_maxsize=50,
+                                          max_retries=Retry(total=2, backoff_factor=0.2)))
+    return session
+
+@st.cache_data(show_spinner=False, ttl=86400, max_entries=5000)
+def _fetch_definition(word):
+    """Fetches the first definition for an already-normalized word.
+
+    Transport errors and unexpected statuses raise, so st.cache_data does not
+    remember them; only a 404 or an empty payload caches the fallback text.
+    """
+    url = f"https://api.dictionaryapi.dev/api/v2/entries/en/{word}"
+    response = _get_session().get(url, timeout=3)
+    if response.status_code == 404:
+        return NO_DEFINITION
+    if response.status_code != 200:
+        raise RuntimeError(f"Dictionary API returned HTTP {response.status_code}")
+    try:
+        return _extract_definition(response.json())
+    except (ValueError, LookupError, TypeError):
+        return NO_DEFINITION
+
+async def _fetch_one(session, word):
+    """Returns the definition, NO_DEFINITION on a 404, or None if the lookup failed."""
     try:
         url = f"https://api.dictionaryapi.dev/api/v2/entries/en/{word}"
-        response = requests.get(url)
-        if response.status_code == 200:
-            data = response.json()
-            return data[0]['meanings'][0]['definitions'][0]['definition']
+        async with session.get(url) as response:
+            if response.status == 404:
+                return NO_DEFINITION
+            if response.status == 200:
+                return _extract_definition(await response.json())
+    except Exception:
+        pass
+    return None
+
+async def _fetch_all_hints(words):
+    import aiohttp
+
+    # Per-socket timeouts only: a total= timeout would also count time spent queued for one of the pooled connections
+    timeout = aiohttp.ClientTimeout(total=None, sock_connect=3, sock_read=3)
+    connector = aiohttp.TCPConnector(limit=10)
+    async with aiohttp.ClientSession(timeout=timeout, connector=connector) as s:
+        tasks = [asyncio.ensure_future(_fetch_one(s, w)) for w in words]
+        # Whole-batch deadline; lookups still pending are cancelled and reported as failed
+        done, pending = await asyncio.wait(tasks, timeout=HINT_PREFETCH_DEADLINE)
+        for task in pending:
+            task.cancel()
+        await asyncio.gather(*pending, return_exceptions=True)
+        return [task.result() if task in done else None for task in tasks]
+
+@st.cache_resource
+def _hint_store():
+    """Normalized word -> definition."""
+    return _PrefetchStore()
+
+def prefetch_hints(words):
+    """Fetches definitions for words not yet in the shared store, concurrently."""
+    store = _hint_store()
+    # Lock-free check first, so fully cached vocabularies never wait on another session
+    words = store.missing(dict.fromkeys(_normalize_word(w) for w in words))
+    if not words:
+        return
+    words = store.claim(words)
+    if not words:
+        return
+    fetched = {}
+    try:
+        # Run the event loop in its own thread so it never clashes with an existing loop
+        with concurrent.futures.ThreadPoolExecutor(max_workers=1) as pool:
+            definitions = pool.submit(asyncio.run, _fetch_all_hints(words)).result()
+        # Failed lookups stay out of the store so a later load retries them
+        fetched = {w: d for w, d in zip(words, definitions) if d is not None}
     except Exception:
         pass
-    return "No definition found."
+    finally:
+        store.update(fetched, released=words)
+
+def fetch_hint(word):
+    """Fetches definition from Dictionary API."""
+    word = _normalize_word(word)
+    definition = _hint_store().get(word)
+    if definition is not None:
+        return definition
+    try:
+        return _fetch_definition(word)
+    except Exception:
+        # Not cached, so the next click retries
+        return NO_DEFINITION
 
-def load_data(file):
+@st.cache_data(show_spinner=False, max_entries=32)
+def _read_excel(file_bytes, name):
+    """Parses the workbook once per distinct file; name is only part of the cache key."""
+    import pandas as pd
+
+    return pd.read_excel(io.BytesIO(file_bytes))
+
+def load_data(file_bytes, name):
     try:
-        df = pd.read_excel(file)
+        df = _read_excel(file_bytes, name)
         if 'English' not in df.columns or 'Korean' not in df.columns:
             st.error("Excel must have 'English' and 'Korean' columns.")
             return None
+        # Normalize answers once at ingest instead of on every submit
+        df['_English_norm'] = df['English'].astype(str).map(normalize_answer)
+        df['_Korean_norm'] = df['Korean'].astype(str).map(normalize_answer)
         return df
     except Exception as e:
         st.error(f"Error loading file: {e}")
         return None
 
-# --- Session State Initialization ---
-if 'data' not in st.session_state:
-    st.session_state.data = None
-if 'current_index' not in st.session_state:
+def nav_label(i, status):
+    """Sidebar button label for question i given its result code."""
+    emoji = _STATUS_EMOJI[status + 1]
+    return f"{i+1} {emoji}" if emoji else f"{i+1}"
+
+@st.cache_resource
+def nav_widget_ids(n):
+    """(widget key, help text) per question, built once per vocabulary size."""
+    return tuple((f"nav_{i}", f"Go to Question {i+1}") for i in range(n))
+
+def new_results(n):
+    return np.full(n, UNANSWERED, dtype=np.int8)
+
+def current_score():
+    return int((st.session_state.results == CORRECT).sum())
+
+# --- Navigation Callbacks ---
+def _goto(i):
+    st.session_state.current_index = i
+    st.session_state.input_key += 1 # Reset input
+
+def _next_question():
+    if st.session_state.current_index < st.session_state.total_words - 1:
+        _goto(st.session_state.current_index + 1)
+    else:
+        st.session_state.quiz_finished = True
+
+def _reset_quiz():
     st.session_state.current_index = 0
-if 'score' not in st.session_state:
-    st.session_state.score = 0
-if 'results' not in st.session_state:
-    st.session_state.results = []
-if 'input_key' not in st.session_state:
-    st.session_state.input_key = 0  # To reset input field
+    st.session_state.results = new_results(st.session_state.total_words)
+    st.session_state.nav_labels = [nav_label(i, UNANSWERED) for i in range(st.session_state.total_words)]
+    st.session_state.input_key += 1
+
+def _store_vocabulary(df, engine):
+    """Resets the quiz for a freshly loaded vocabulary and warms the shared audio/hint stores."""
+    st.session_state.data = df
+    st.session_state.total_words = len(df)
+    # Parallel per-column lists: cheaper to index per rerun than df.iloc
+    st.session_state.english = df['English'].astype(str).tolist()
+    st.session_state.korean = df['Korean'].astype(str).tolist()
+    st.session_state.english_norm = df['_English_norm'].tolist()
+    st.session_state.korean_norm = df['_Korean_norm'].tolist()
+    st.session_state.kor_index = build_meaning_index(st.session_state.korean)
+    st.session_state.current_index = 0
+    st.session_state.results = new_results(len(df))
+    st.session_state.nav_labels = [nav_label(i, UNANSWERED) for i in range(len(df))]
+    prefetch_audio(st.session_state.english, engine)
+    prefetch_hints(st.session_state.english)
+
+# --- Session State Initialization ---
+for key, default in {
+    'data': None,
+    'current_index': 0,
+    'results': new_results(0),
+    'input_key': 0,  # To reset input field
+    'nav_labels': [],
+}.items():
+    st.session_state.setdefault(key, default)
 
 # ... (Previous code)
 
@@ -88,19 +398,18 @@ st.sidebar.title("Navigation")
 # Mode Selector
 mode = st.sidebar.radio("Quiz Mode", ["Reading (Eng -> Kor)", "Dictation (Listen -> Write)"])
 
+# Voice Engine
+tts_engine = 'edge' if st.sidebar.toggle("Edge neural voice", help="Use Microsoft Edge TTS instead of Google TTS") else 'gtts'
+
 # File Uploader
 uploaded_file = st.sidebar.file_uploader("📂 Upload Vocabulary (.xlsx)", type=['xlsx'])
 
 if uploaded_file:
     # Load new data if changed
     if st.session_state.data is None or (hasattr(uploaded_file, 'name') and st.session_state.get('last_file') != uploaded_file.name):
-        df = load_data(uploaded_file)
+        df = load_data(uploaded_file.getvalue(), uploaded_file.name)
         if df is not None:
-            st.session_state.data = df
-            st.session_state.total_words = len(df)
-            st.session_state.current_index = 0
-            st.session_state.score = 0
-            st.session_state.results = [None] * len(df)
+            _store_vocabulary(df, tts_engine)
             st.session_state.last_file = uploaded_file.name
             st.rerun()
 
@@ -108,11 +417,9 @@ if uploaded_file:
 if st.session_state.data is None:
     try:
         # Try loading default
-        df = load_data('vocabulary.xlsx')
+        df = load_data(Path('vocabulary.xlsx').read_bytes(), 'vocabulary.xlsx')
         if df is not None:
-            st.session_state.data = df
-            st.session_state.total_words = len(df)
-            st.session_state.results = [None] * len(df)
+            _store_vocabulary(df, tts_engine)
     except:
         st.info("Please upload an Excel file to start.")
 
@@ -120,55 +427,38 @@ if st.session_state.data is None:
 if st.session_state.data is not None:
     st.sidebar.subheader("Questions")
     
+    # Only render one page of buttons at a time so large vocab files stay responsive
+    total = st.session_state.total_words
+    page_count = (total + NAV_PAGE_SIZE - 1) // NAV_PAGE_SIZE
+    page = 0
+    if page_count > 1:
+        # No key: the default follows the current question, so 'Next' flips pages automatically
+        page = st.sidebar.selectbox(
+            "Page",
+            range(page_count),
+            index=st.session_state.current_index // NAV_PAGE_SIZE,
+            format_func=lambda p: f"{p * NAV_PAGE_SIZE + 1}–{min((p + 1) * NAV_PAGE_SIZE, total)}",
+        )
+
     # Grid layout for buttons
     cols = st.sidebar.columns(5)
-    for i in range(st.session_state.total_words):
-        status = st.session_state.results[i]
-        label = f"{i+1}"
-        
-        # Color logic
-        if status is True:
-            emoji = "✅"
-            kind = "primary"
-        elif status is False:
-            emoji = "❌"
-            kind = "secondary"
-        else:
-            emoji = ""
-            kind = "secondary"
-            
-        btn_label = f"{label} {emoji}" if emoji else label
-        
-        if cols[i%5].button(btn_label, key=f"nav_{i}", help=f"Go to Question {i+1}", use_container_width=True):
-            st.session_state.current_index = i
-            st.session_state.input_key += 1 # Reset input
-            st.rerun()
-
-    if st.sidebar.button("↻ Reset Quiz", use_container_width=True):
-        st.session_state.current_index = 0
-        st.session_state.score = 0
-        st.session_state.results = [None] * st.session_state.total_words
-        st.session_state.input_key += 1
-        st.rerun()
+    widget_ids = nav_widget_ids(total)
+    for i in range(page * NAV_PAGE_SIZE, min((page + 1) * NAV_PAGE_SIZE, total)):
+        key, help_text = widget_ids[i]
+        cols[i%5].button(st.session_state.nav_labels[i], key=key, help=help_text, use_container_width=True,
+                         on_click=_goto, args=(i,))
 
-# --- Main App ---
-st.title("English Vocabulary Quiz")
-
-if st.session_state.data is not None:
-    idx = st.session_state.current_index
-    row = st.session_state.data.iloc[idx]
-    english_word = row['English']
-    korean_meaning = row['Korean']
+    st.sidebar.button("↻ Reset Quiz", use_container_width=True, on_click=_reset_quiz)
 
-    # Progress
-    st.progress((idx + 1) / st.session_state.total_words)
-    st.write(f"**Question {idx + 1} / {st.session_state.total_words}** | **Score: {st.session_state.score}**")
+# --- Question Panel ---
+@st.fragment
+def question_panel(idx, is_dictation, english_word, korean_meaning, english_norm, tts_engine):
+    """Word display, audio/hint controls and answer form for one question.
 
-    st.markdown("---")
-    
+    Runs as a fragment, so submits and audio/hint clicks only rerun this panel;
+    switching questions goes through a full rerun.
+    """
     # Word Display Area
-    is_dictation = mode == "Dictation (Listen -> Write)"
-    
     if is_dictation:
         # Hide word, show placeholder
         display_text = "❓ ❓ ❓"
@@ -183,14 +473,14 @@ if st.session_state.data is not None:
         # In Dictation, audio is crucial, so we might want to autoplay or highlight it
         label = "🔊 Play Word" + (" (Listen!)" if is_dictation else "")
         if st.button(label, key=f"audio_{idx}", use_container_width=True):
-            st.markdown(get_audio_html(english_word), unsafe_allow_html=True)
+            play_audio(english_word, tts_engine)
             
     with c2:
         if st.button("💡 Hint", key=f"hint_{idx}", use_container_width=True):
             with st.spinner("Fetching definition..."):
                 definition = fetch_hint(english_word)
                 st.info(f"Hint: {definition}")
-                st.markdown(get_audio_html(definition), unsafe_allow_html=True)
+                play_audio(definition, tts_engine)
 
     st.markdown("---")
 
@@ -211,10 +501,10 @@ if st.session_state.data is not None:
 
         if submitted:
             # Check logic
-            correct_meaning = is_correct(user_meaning, korean_meaning)
+            correct_meaning = is_correct_meaning(user_meaning, idx)
             
             if is_dictation:
-                correct_spelling = is_correct(user_spelling, english_word)
+                correct_spelling = is_correct(user_spelling, english_norm)
                 is_right = correct_meaning and correct_spelling
                 
                 if is_right:
@@ -232,25 +522,33 @@ if st.session_state.data is not None:
                     st.error(f"Incorrect. Answer: {korean_meaning}")
 
             # Grading
-            if is_right:
-                if st.session_state.results[idx] is not True: 
-                    st.session_state.score += 1
-                st.session_state.results[idx] = True
-            else:
-                st.session_state.results[idx] = False
+            st.session_state.results[idx] = CORRECT if is_right else WRONG
+            st.session_state.nav_labels[idx] = nav_label(idx, st.session_state.results[idx])
             
             # Show Next Button outside form (to avoid nested form issues, Streamlit quirks)
             st.session_state.show_next = True
 
+# --- Main App ---
+st.title("English Vocabulary Quiz")
+
+if st.session_state.data is not None:
+    idx = st.session_state.current_index
+    english_word = st.session_state.english[idx]
+    korean_meaning = st.session_state.korean[idx]
+    english_norm = st.session_state.english_norm[idx]
+
+    # Progress
+    st.progress((idx + 1) / st.session_state.total_words)
+    st.write(f"**Question {idx + 1} / {st.session_state.total_words}** | **Score: {current_score()}**")
+
+    st.markdown("---")
+    
+    question_panel(idx, mode == "Dictation (Listen -> Write)", english_word, korean_meaning, english_norm, tts_engine)
+
     # Next Navigation (Simple 'Next' button below form)
-    if st.button("Next Question ➡️"):
-        if st.session_state.current_index < st.session_state.total_words - 1:
-            st.session_state.current_index += 1
-            st.session_state.input_key += 1
-            st.rerun()
-        else:
-            st.balloons()
-            st.success(f"Quiz Finished! Final Score: {st.session_state.score} / {st.session_state.total_words}")
+    if st.button("Next Question ➡️", on_click=_next_question) and st.session_state.pop('quiz_finished', False):
+        st.balloons()
+        st.success(f"Quiz Finished! Final Score: {current_score()} / {st.session_state.total_words}")
 
 else:
     st.warning("No vocabulary data loaded. Please upload a file.")